@@ -5,14 +5,19 @@ API REST para servir notícias financeiras do banco SQLite
 Servidor Flask com CORS e autenticação via API Key
 """
 
-from flask import Flask, jsonify, request, make_response
-import sqlite3
+from flask import Flask, Response, request
 from datetime import datetime
 from typing import List, Dict
-from functools import wraps
+from functools import wraps, lru_cache
 import os
 import re
+import hmac
+import hashlib
+import orjson
+import time
+import threading
 from dotenv import load_dotenv
+from db_pool import ConnectionPool, MemoryMirror, database_version
 
 # Carregar variáveis de ambiente
 load_dotenv()
@@ -23,13 +28,35 @@ app = Flask(__name__)
 
 # Importar configurações
 try:
-    from config import DB_NAME, API_KEY, PORT, DEBUG
+    from config import DB_NAME, API_KEY, PORT, DEBUG, DB_POOL_SIZE, DB_IN_MEMORY, REFRESH_INTERVAL
 except ImportError:
     # Fallback para desenvolvimento sem config.py
     DB_NAME = "noticias.db"
     API_KEY = os.getenv('API_KEY', 'dev-key-12345')
     PORT = int(os.getenv('PORT', 5000))
     DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
+    DB_POOL_SIZE = 2
+    DB_IN_MEMORY = False
+    REFRESH_INTERVAL = 30
+
+# API Key pré-codificada para comparação em tempo constante
+API_KEY_BYTES = API_KEY.encode()
+
+# Pool de conexões reutilizadas entre requisições
+# (ou cópia em memória do banco, para tráfego de leitura muito alto)
+if DB_IN_MEMORY:
+    db_pool = MemoryMirror(DB_NAME)
+else:
+    db_pool = ConnectionPool(DB_NAME, DB_POOL_SIZE)
+
+
+def json_response(data, status=200):
+    """
+    Serializa a resposta com orjson (UTF-8 direto, sem escapar acentos).
+    Substitui o jsonify do Flask em todos os endpoints.
+    """
+    return Response(orjson.dumps(data), status=status, mimetype='application/json')
+
 
 # Configuração de origens permitidas (CORS)
 ALLOWED_ORIGINS = os.getenv('ALLOWED_ORIGINS', '*').split(',')
@@ -39,36 +66,50 @@ ALLOWED_ORIGINS = [origin.strip() for origin in ALLOWED_ORIGINS]
 print(f"🔒 CORS configurado com origens permitidas: {ALLOWED_ORIGINS}")
 
 
+def compile_origin_pattern(allowed):
+    """Converte uma origem com wildcard em regex compilada"""
+    # *.operebem.com -> ^https?://.*\.operebem\.com$
+    pattern = allowed.replace('.', '\\.').replace('*', '.*')
+    # Adicionar protocolo se não tiver
+    if not pattern.startswith('http'):
+        pattern = f'^https?://{pattern}$'
+    else:
+        pattern = f'^{pattern}$'
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Origens pré-processadas uma única vez (evita montar regex a cada requisição)
+ALLOW_ALL_ORIGINS = '*' in ALLOWED_ORIGINS
+EXACT_ORIGINS = frozenset(allowed for allowed in ALLOWED_ORIGINS if '*' not in allowed)
+WILDCARD_PATTERNS = [
+    compile_origin_pattern(allowed)
+    for allowed in ALLOWED_ORIGINS
+    if '*' in allowed and allowed != '*'
+]
+
+
+@lru_cache(maxsize=256)
 def is_origin_allowed(origin):
     """
     Verifica se a origem é permitida.
     Suporta wildcards (*.operebem.com) e domínios exatos.
+    Resultado memoizado por origem (chamada em before_request e after_request).
     """
     if not origin:
         return False
     
     # Se permitir todas as origens
-    if '*' in ALLOWED_ORIGINS:
+    if ALLOW_ALL_ORIGINS:
         return True
     
     # Verificar domínios exatos
-    if origin in ALLOWED_ORIGINS:
+    if origin in EXACT_ORIGINS:
         return True
     
     # Verificar wildcards
-    for allowed in ALLOWED_ORIGINS:
-        if '*' in allowed:
-            # Converter wildcard para regex
-            # *.operebem.com -> ^https?://.*\.operebem\.com$
-            pattern = allowed.replace('.', '\\.').replace('*', '.*')
-            # Adicionar protocolo se não tiver
-            if not pattern.startswith('http'):
-                pattern = f'^https?://{pattern}$'
-            else:
-                pattern = f'^{pattern}$'
-            
-            if re.match(pattern, origin, re.IGNORECASE):
-                return True
+    for pattern in WILDCARD_PATTERNS:
+        if pattern.match(origin):
+            return True
     
     return False
 
@@ -93,25 +134,33 @@ def check_origin():
     # Se não tiver origem (requisições diretas de ferramentas como Postman, cURL, ReqBin)
     if not origin:
         print(f"❌ BLOQUEADO: Requisição sem header Origin")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Acesso negado: Requisições devem ser feitas através de um navegador com origem válida',
             'code': 'CORS_NO_ORIGIN'
-        }), 403
+        }, 403)
     
     # Verificar se a origem é permitida
     if not is_origin_allowed(origin):
         print(f"❌ BLOQUEADO: Origem '{origin}' não está na lista permitida")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': f'Acesso negado: Origem {origin} não autorizada',
             'code': 'CORS_ORIGIN_DENIED'
-        }), 403
+        }, 403)
     
     print(f"✅ PERMITIDO: Origem '{origin}' autorizada")
     return None
 
 
+# Headers CORS fixos (Access-Control-Allow-Origin depende da requisição)
+CORS_HEADERS = [
+    ('Access-Control-Allow-Methods', 'GET, POST, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'Content-Type, X-API-Key'),
+    ('Access-Control-Allow-Credentials', 'true'),
+]
+
+
 @app.after_request
 def add_cors_headers(response):
     """
@@ -121,26 +170,30 @@ def add_cors_headers(response):
     
     if is_origin_allowed(origin):
         response.headers['Access-Control-Allow-Origin'] = origin
-        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, X-API-Key'
-        response.headers['Access-Control-Allow-Credentials'] = 'true'
+        for name, value in CORS_HEADERS:
+            response.headers[name] = value
     
     return response
 
 
-@app.route('/api/<path:path>', methods=['OPTIONS'])
-def handle_options(path):
+def preflight_middleware(wsgi_app):
     """
-    Responde a requisições OPTIONS (preflight CORS).
+    Responde a requisições OPTIONS (preflight CORS) em /api/* direto no WSGI,
+    sem passar pelo roteamento, before_request e after_request do Flask.
+    Origens ausentes ou não permitidas seguem para o Flask (check_origin responde 403).
     """
-    return '', 204
+    def middleware(environ, start_response):
+        if environ['REQUEST_METHOD'] == 'OPTIONS' and environ.get('PATH_INFO', '').startswith('/api/'):
+            origin = environ.get('HTTP_ORIGIN')
+            if is_origin_allowed(origin):
+                start_response('204 No Content', [('Access-Control-Allow-Origin', origin)] + CORS_HEADERS)
+                return []
+        
+        return wsgi_app(environ, start_response)
+    return middleware
 
 
-def get_db_connection():
-    """Cria conexão com o banco de dados SQLite"""
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row  # Permite acessar colunas por nome
-    return conn
+app.wsgi_app = preflight_middleware(app.wsgi_app)
 
 
 def require_api_key(f):
@@ -150,27 +203,96 @@ def require_api_key(f):
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        # Verificar header
-        api_key = request.headers.get('X-API-Key')
-        
-        # Se não estiver no header, verificar query param
-        if not api_key:
-            api_key = request.args.get('api_key')
+        # Verificar header (ou query param, se não estiver no header)
+        api_key = request.headers.get('X-API-Key') or request.args.get('api_key')
         
-        # Validar API Key
-        if not api_key or api_key != API_KEY:
-            return jsonify({
+        # Validar API Key (compare_digest evita ataque de timing)
+        if not api_key or not hmac.compare_digest(api_key.encode(), API_KEY_BYTES):
+            return json_response({
                 'success': False,
                 'error': 'API Key inválida ou ausente',
                 'message': 'Forneça uma API Key válida no header X-API-Key ou query param api_key'
-            }), 401
+            }, 401)
         
         return f(*args, **kwargs)
     return decorated_function
 
 
+# Cache de respostas: chave -> (momento, versão do banco, corpo JSON)
+RESPONSE_CACHE = {}
+RESPONSE_CACHE_LOCK = threading.Lock()
+RESPONSE_CACHE_MAX_ENTRIES = 128
+
+
+def get_request_key():
+    """Identifica a consulta: rota + query params (exceto a API Key)"""
+    return (request.path, tuple(sorted(
+        (name, value) for name, value in request.args.items(multi=True)
+        if name != 'api_key'
+    )))
+
+
+def cached_response(f):
+    """
+    Decorator que reaproveita a resposta JSON de um endpoint por até
+    REFRESH_INTERVAL segundos (intervalo entre coletas).
+    O cache é descartado antes disso se o banco for alterado pelo coletor.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        key = get_request_key()
+        version = database_version(DB_NAME)
+        now = time.monotonic()
+        
+        with RESPONSE_CACHE_LOCK:
+            cached = RESPONSE_CACHE.get(key)
+        
+        if cached and cached[1] == version and now - cached[0] < REFRESH_INTERVAL:
+            return Response(cached[2], mimetype='application/json')
+        
+        response = app.make_response(f(*args, **kwargs))
+        
+        # Guardar apenas respostas de sucesso
+        if response.status_code == 200:
+            with RESPONSE_CACHE_LOCK:
+                if len(RESPONSE_CACHE) >= RESPONSE_CACHE_MAX_ENTRIES:
+                    RESPONSE_CACHE.clear()
+                RESPONSE_CACHE[key] = (now, version, response.get_data())
+        
+        return response
+    return decorated_function
+
+
+def conditional_get(f):
+    """
+    Decorator que adiciona ETag e Cache-Control à resposta.
+    Se o cliente enviar If-None-Match com o ETag atual, responde 304 sem corpo
+    (o banco não mudou desde a última consulta).
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        # ETag derivado da versão do banco e dos parâmetros da consulta
+        signature = repr((database_version(DB_NAME), get_request_key())).encode()
+        etag = hashlib.blake2b(signature, digest_size=16).hexdigest()
+        cache_control = f'private, max-age={REFRESH_INTERVAL}'
+        
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = app.make_response(f(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+        
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = cache_control
+        return response
+    return decorated_function
+
+
 @app.route('/api/noticias', methods=['GET'])
 @require_api_key
+@conditional_get
+@cached_response
 def get_noticias():
     """
     Retorna todas as notícias ordenadas da mais recente para a mais antiga.
@@ -182,10 +304,7 @@ def get_noticias():
         fonte = request.args.get('fonte')
         limit = request.args.get('limit', type=int)
         
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        query = """
+        subquery = """
             SELECT id, titulo, link, fonte, data_publicacao, descricao, data_coleta, titulo_pt, descricao_pt
             FROM noticias
         """
@@ -193,62 +312,55 @@ def get_noticias():
         params = []
         
         if fonte:
-            query += " WHERE fonte = ?"
+            subquery += " WHERE fonte = ?"
             params.append(fonte)
         
-        query += " ORDER BY data_publicacao DESC"
-        
-        if limit:
-            query += f" LIMIT {limit}"
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        
-        noticias = []
-        for row in rows:
-            noticias.append({
-                'id': row['id'],
-                'titulo': row['titulo'],
-                'link': row['link'],
-                'fonte': row['fonte'],
-                'data_publicacao': row['data_publicacao'],
-                'descricao': row['descricao'],
-                'data_coleta': row['data_coleta'],
-                'titulo_pt': row['titulo_pt'],
-                'descricao_pt': row['descricao_pt']
-            })
+        # LIMIT -1 = sem limite
+        subquery += " ORDER BY data_publicacao DESC LIMIT ?"
+        params.append(limit if limit else -1)
+        
+        # O próprio SQLite monta o array JSON (sem loop de linhas em Python)
+        query = f"""
+            SELECT COUNT(*), COALESCE(json_group_array(json_object(
+                'id', id,
+                'titulo', titulo,
+                'link', link,
+                'fonte', fonte,
+                'data_publicacao', data_publicacao,
+                'descricao', descricao,
+                'data_coleta', data_coleta,
+                'titulo_pt', titulo_pt,
+                'descricao_pt', descricao_pt
+            )), '[]')
+            FROM ({subquery})
+        """
         
-        conn.close()
+        with db_pool.acquire() as conn:
+            total, noticias_json = conn.execute(query, params).fetchone()
         
-        return jsonify({
-            'success': True,
-            'total': len(noticias),
-            'noticias': noticias
-        })
+        body = f'{{"success":true,"total":{total},"noticias":{noticias_json}}}'
+        return Response(body, mimetype='application/json')
     
     except Exception as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/fontes', methods=['GET'])
 @require_api_key
+@cached_response
 def get_fontes():
     """Retorna lista de todas as fontes disponíveis com contagem de notícias"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT fonte, COUNT(*) as total
-            FROM noticias
-            GROUP BY fonte
-            ORDER BY total DESC
-        """)
-        
-        rows = cursor.fetchall()
+        with db_pool.acquire() as conn:
+            rows = conn.execute("""
+                SELECT fonte, COUNT(*) as total
+                FROM noticias
+                GROUP BY fonte
+                ORDER BY total DESC
+            """).fetchall()
         
         fontes = []
         for row in rows:
@@ -257,77 +369,105 @@ def get_fontes():
                 'total': row['total']
             })
         
-        conn.close()
-        
-        return jsonify({
+        return json_response({
             'success': True,
             'fontes': fontes
         })
     
     except Exception as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
+
+
+# Estatísticas do banco em uma única varredura (usada por /api/stats e /api/uptime)
+DB_STATS_QUERY = """
+    SELECT
+        COUNT(*) AS total_noticias,
+        COUNT(DISTINCT fonte) AS total_fontes,
+        MAX(data_coleta) AS ultima_coleta,
+        MAX(data_publicacao) AS ultima_publicacao
+    FROM noticias
+"""
 
 
 @app.route('/api/stats', methods=['GET'])
 @require_api_key
+@cached_response
 def get_stats():
     """Retorna estatísticas gerais do sistema"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Total de notícias
-        cursor.execute("SELECT COUNT(*) as total FROM noticias")
-        total = cursor.fetchone()['total']
-        
-        # Notícia mais recente (usar data_coleta que é sempre confiável)
-        cursor.execute("""
-            SELECT data_coleta 
-            FROM noticias 
-            ORDER BY data_coleta DESC 
-            LIMIT 1
-        """)
-        ultima_row = cursor.fetchone()
-        ultima_atualizacao = ultima_row['data_coleta'] if ultima_row else None
-        
-        # Total por fonte
-        cursor.execute("""
-            SELECT COUNT(DISTINCT fonte) as total_fontes
-            FROM noticias
-        """)
-        total_fontes = cursor.fetchone()['total_fontes']
-        
-        conn.close()
+        with db_pool.acquire() as conn:
+            stats = conn.execute(DB_STATS_QUERY).fetchone()
         
-        return jsonify({
+        return json_response({
             'success': True,
             'stats': {
-                'total_noticias': total,
-                'total_fontes': total_fontes,
-                'ultima_atualizacao': ultima_atualizacao
+                'total_noticias': stats['total_noticias'],
+                'total_fontes': stats['total_fontes'],
+                # Notícia mais recente (usar data_coleta que é sempre confiável)
+                'ultima_atualizacao': stats['ultima_coleta']
             }
         })
     
     except Exception as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Endpoint de health check público"""
-    return jsonify({
+    return json_response({
         'success': True,
         'status': 'online',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': datetime.now()
     })
 
 
+# Métricas do sistema reaproveitadas por alguns segundos (leituras de /proc e statvfs)
+SYSTEM_METRICS_TTL = 5
+SYSTEM_METRICS_CACHE = {}
+SYSTEM_METRICS_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_static_system_info():
+    """Informações do sistema que não mudam durante a vida do processo (requer psutil)"""
+    import platform
+    import psutil
+    
+    return {
+        'platform': platform.system(),
+        'python_version': platform.python_version(),
+        'cpu_count': psutil.cpu_count()
+    }
+
+
+def get_cached_metric(name, compute):
+    """Retorna o resultado de compute(), recalculado no máximo a cada SYSTEM_METRICS_TTL segundos"""
+    now = time.monotonic()
+    
+    with SYSTEM_METRICS_LOCK:
+        cached = SYSTEM_METRICS_CACHE.get(name)
+    
+    if cached and now - cached[0] < SYSTEM_METRICS_TTL:
+        return cached[1]
+    
+    value = compute()
+    with SYSTEM_METRICS_LOCK:
+        SYSTEM_METRICS_CACHE[name] = (now, value)
+    return value
+
+
+def get_db_size(db_name):
+    """Tamanho do arquivo do banco em bytes (0 se ainda não existir)"""
+    return os.path.getsize(db_name) if os.path.exists(db_name) else 0
+
+
 @app.route('/api/uptime', methods=['GET'])
 @require_api_key
 def uptime_status():
@@ -336,31 +476,15 @@ def uptime_status():
     Retorna informações sobre banco de dados, última coleta, sistema, etc.
     """
     try:
-        import os
-        import platform
         import psutil
         from config import DB_NAME, IS_PRODUCTION, REFRESH_INTERVAL, MAX_AGE_HOURS
         
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         # Estatísticas do banco
-        cursor.execute("SELECT COUNT(*) FROM noticias")
-        total_noticias = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(DISTINCT fonte) FROM noticias")
-        total_fontes = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT data_coleta FROM noticias ORDER BY data_coleta DESC LIMIT 1")
-        ultima_coleta = cursor.fetchone()
-        ultima_coleta = ultima_coleta[0] if ultima_coleta else None
-        
-        cursor.execute("SELECT data_publicacao FROM noticias ORDER BY data_publicacao DESC LIMIT 1")
-        ultima_publicacao = cursor.fetchone()
-        ultima_publicacao = ultima_publicacao[0] if ultima_publicacao else None
+        with db_pool.acquire() as conn:
+            stats = conn.execute(DB_STATS_QUERY).fetchone()
         
         # Informações do banco de dados
-        db_size = os.path.getsize(DB_NAME) if os.path.exists(DB_NAME) else 0
+        db_size = get_cached_metric('db_size', lambda: get_db_size(DB_NAME))
         db_size_mb = round(db_size / (1024 * 1024), 2)
         
         # Verificar tipo de storage
@@ -373,20 +497,17 @@ def uptime_status():
             storage_type = "local"
         
         # Informações do sistema
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        system_info = get_static_system_info()
+        memory = get_cached_metric('memory', psutil.virtual_memory)
+        disk = get_cached_metric('disk', lambda: psutil.disk_usage('/'))
         
-        conn.close()
-        
-        return jsonify({
+        return json_response({
             'success': True,
             'status': 'online',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'system': {
                 'environment': 'production' if IS_PRODUCTION else 'development',
-                'platform': platform.system(),
-                'python_version': platform.python_version(),
-                'cpu_count': psutil.cpu_count(),
+                **system_info,
                 'memory': {
                     'total_mb': round(memory.total / (1024 * 1024), 2),
                     'used_mb': round(memory.used / (1024 * 1024), 2),
@@ -402,10 +523,10 @@ def uptime_status():
                 'path': DB_NAME,
                 'size_mb': db_size_mb,
                 'storage_type': storage_type,
-                'total_noticias': total_noticias,
-                'total_fontes': total_fontes,
-                'ultima_coleta': ultima_coleta,
-                'ultima_publicacao': ultima_publicacao
+                'total_noticias': stats['total_noticias'],
+                'total_fontes': stats['total_fontes'],
+                'ultima_coleta': stats['ultima_coleta'],
+                'ultima_publicacao': stats['ultima_publicacao']
             },
             'config': {
                 'refresh_interval_seconds': REFRESH_INTERVAL,
@@ -417,23 +538,12 @@ def uptime_status():
     except ImportError:
         # psutil não instalado - versão simplificada
         try:
-            import os
             from config import DB_NAME, IS_PRODUCTION, REFRESH_INTERVAL, MAX_AGE_HOURS
             
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM noticias")
-            total_noticias = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(DISTINCT fonte) FROM noticias")
-            total_fontes = cursor.fetchone()[0]
+            with db_pool.acquire() as conn:
+                stats = conn.execute(DB_STATS_QUERY).fetchone()
             
-            cursor.execute("SELECT data_coleta FROM noticias ORDER BY data_coleta DESC LIMIT 1")
-            ultima_coleta = cursor.fetchone()
-            ultima_coleta = ultima_coleta[0] if ultima_coleta else None
-            
-            db_size = os.path.getsize(DB_NAME) if os.path.exists(DB_NAME) else 0
+            db_size = get_cached_metric('db_size', lambda: get_db_size(DB_NAME))
             db_size_mb = round(db_size / (1024 * 1024), 2)
             
             storage_type = "ephemeral"
@@ -442,12 +552,10 @@ def uptime_status():
             elif '/app/' in DB_NAME:
                 storage_type = "ephemeral"
             
-            conn.close()
-            
-            return jsonify({
+            return json_response({
                 'success': True,
                 'status': 'online',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': datetime.now(),
                 'system': {
                     'environment': 'production' if IS_PRODUCTION else 'development'
                 },
@@ -455,9 +563,9 @@ def uptime_status():
                     'path': DB_NAME,
                     'size_mb': db_size_mb,
                     'storage_type': storage_type,
-                    'total_noticias': total_noticias,
-                    'total_fontes': total_fontes,
-                    'ultima_coleta': ultima_coleta
+                    'total_noticias': stats['total_noticias'],
+                    'total_fontes': stats['total_fontes'],
+                    'ultima_coleta': stats['ultima_coleta']
                 },
                 'config': {
                     'refresh_interval_seconds': REFRESH_INTERVAL,
@@ -465,16 +573,16 @@ def uptime_status():
                 }
             })
         except Exception as e:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': str(e)
-            }), 500
+            }, 500)
     
     except Exception as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 if __name__ == '__main__':
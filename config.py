@@ -48,3 +48,5 @@ MAX_AGE_HOURS = int(os.getenv('MAX_AGE_HOURS', '24'))  # horas
 # Configurações de performance
 MAX_WORKERS = int(os.getenv('MAX_WORKERS', '1'))  # Gunicorn workers
 THREADS_PER_WORKER = int(os.getenv('THREADS_PER_WORKER', '2'))  # Threads por worker
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', str(MAX_WORKERS * THREADS_PER_WORKER)))  # Conexões SQLite da API
+DB_IN_MEMORY = os.getenv('DB_IN_MEMORY', 'False').lower() == 'true'  # Leituras da API em cópia :memory:
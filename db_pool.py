@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pool de conexões SQLite para a API
+Mantém conexões de leitura abertas entre requisições (cache de páginas quente)
+ou uma cópia do banco em memória, e centraliza a configuração (PRAGMAs)
+usada também pelo coletor
+"""
+
+import os
+import sqlite3
+import queue
+import threading
+from contextlib import contextmanager
+
+
+# Tempo máximo (segundos) aguardando o banco liberar um lock
+BUSY_TIMEOUT = 30
+
+# PRAGMAs aplicados em toda conexão aberta (valem apenas para a conexão).
+# journal_mode=WAL é persistente no arquivo e definido em criar_banco_dados().
+CONNECTION_PRAGMAS = (
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT * 1000}",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",       # ~20 MB de cache de páginas
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",     # 256 MB mapeados em memória
+)
+
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Aplica os PRAGMAs de performance em uma conexão recém-aberta"""
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def database_version(db_name: str) -> tuple:
+    """
+    Retorna uma assinatura barata do estado do banco (mtime do arquivo e do WAL).
+    Muda sempre que o coletor grava algo, sem precisar consultar o SQLite.
+    """
+    version = []
+    for path in (db_name, f"{db_name}-wal"):
+        try:
+            version.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            version.append(0)
+    return tuple(version)
+
+
+class ConnectionPool:
+    """
+    Pool thread-safe de conexões somente leitura com o banco SQLite.
+    As conexões são abertas sob demanda (até `size`) e devolvidas ao pool
+    após o uso, em vez de serem fechadas a cada requisição.
+    """
+
+    def __init__(self, db_name: str, size: int):
+        self.db_name = db_name
+        self.size = max(1, size)
+        self._pool = queue.Queue(maxsize=self.size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre uma nova conexão somente leitura já configurada"""
+        conn = sqlite3.connect(
+            f"file:{self.db_name}?mode=ro",
+            uri=True,
+            timeout=BUSY_TIMEOUT,
+            check_same_thread=False
+        )
+        configure_connection(conn)
+        conn.row_factory = sqlite3.Row  # Permite acessar colunas por nome
+        return conn
+
+    def _get(self) -> sqlite3.Connection:
+        """
+        Retorna uma conexão livre do pool.
+        Abre uma nova se o pool ainda não atingiu o tamanho máximo;
+        caso contrário, aguarda outra requisição devolver a sua.
+        """
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                conn = self._connect()
+                self._created += 1
+                return conn
+
+        return self._pool.get()
+
+    @contextmanager
+    def acquire(self):
+        """
+        Context manager que empresta uma conexão do pool:
+
+            with db_pool.acquire() as conn:
+                conn.execute(...)
+        """
+        conn = self._get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+
+class MemoryMirror:
+    """
+    Cópia em memória (:memory:) da tabela noticias para as leituras da API.
+    Mesma interface do ConnectionPool (acquire()), com uma única conexão
+    protegida por lock: as consultas não passam pelo sistema de arquivos.
+    A cópia é refeita sempre que database_version() indica que o coletor gravou.
+    """
+
+    # Índices recriados na cópia (os mesmos usados pelas consultas da API)
+    INDEXES = (
+        "CREATE INDEX idx_data_publicacao ON noticias(data_publicacao)",
+        "CREATE INDEX idx_fonte_pub ON noticias(fonte, data_publicacao DESC)",
+        "CREATE INDEX idx_data_coleta ON noticias(data_coleta)",
+    )
+
+    def __init__(self, db_name: str):
+        self.db_name = db_name
+        self._conn = sqlite3.connect(
+            ":memory:",
+            uri=True,
+            timeout=BUSY_TIMEOUT,
+            check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row  # Permite acessar colunas por nome
+        self._version = None
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        """Recarrega a cópia a partir do arquivo se o banco mudou"""
+        version = database_version(self.db_name)
+        if version == self._version:
+            return
+
+        conn = self._conn
+        conn.execute("ATTACH DATABASE ? AS disk", (f"file:{self.db_name}?mode=ro",))
+        try:
+            # Montar a nova cópia ao lado da atual: se falhar, a anterior continua valendo
+            conn.execute("DROP TABLE IF EXISTS main.noticias_nova")
+            conn.execute("CREATE TABLE main.noticias_nova AS SELECT * FROM disk.noticias")
+            conn.execute("DROP TABLE IF EXISTS main.noticias")
+            conn.execute("ALTER TABLE main.noticias_nova RENAME TO noticias")
+            for index in self.INDEXES:
+                conn.execute(index)
+        finally:
+            conn.execute("DETACH DATABASE disk")
+
+        self._version = version
+
+    @contextmanager
+    def acquire(self):
+        """
+        Context manager que empresta a conexão em memória já sincronizada:
+
+            with db_pool.acquire() as conn:
+                conn.execute(...)
+        """
+        with self._lock:
+            try:
+                self._refresh()
+            except sqlite3.Error:
+                # Sem cópia anterior não há o que servir
+                if self._version is None:
+                    raise
+            yield self._conn
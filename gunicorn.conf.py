@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+Configuração do Gunicorn para produção
+Workers gevent: as requisições são I/O (SQLite + rede), então cada worker
+atende muitas conexões simultâneas em vez de apenas THREADS_PER_WORKER
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+
+# Workers assíncronos
+worker_class = 'gevent'
+# Mesmo valor de config.MAX_WORKERS. O usual seria (2 x CPUs) + 1, mas no
+# Railway cpu_count() enxerga a máquina host e estouraria a memória do container.
+workers = int(os.getenv('MAX_WORKERS', '1'))
+worker_connections = 1000
+keepalive = 5
+
+timeout = 120
+max_requests = 1000
+max_requests_jitter = 50
+
+# Logs no stdout/stderr (Railway)
+accesslog = '-'
+errorlog = '-'
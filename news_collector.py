@@ -10,14 +10,17 @@ import sqlite3
 import feedparser
 import time
 import argparse
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import sys
 import re
 from html import unescape
 from deep_translator import GoogleTranslator
 from langdetect import detect, LangDetectException
+from concurrent.futures import ThreadPoolExecutor
 import os
+from db_pool import BUSY_TIMEOUT, configure_connection
 
 # Importar configurações
 try:
@@ -51,17 +54,36 @@ RSS_FEEDS = [
     {"url": "https://www.coindesk.com/arc/outboundfeeds/rss/", "fonte": "CoinDesk"},
 ]
 
+# Limite de caracteres por requisição de tradução em lote (API aceita até 5000)
+LIMITE_LOTE_TRADUCAO = 4500
+
+# Tradutor em segundo plano: notícias por lote e espera (segundos) quando não há pendentes
+LOTE_TRADUCAO = 20
+INTERVALO_TRADUCAO = 5
+
 
 # ==================== BANCO DE DADOS ====================
 
+def conectar_banco() -> sqlite3.Connection:
+    """
+    Abre uma conexão de escrita com o banco já configurada (WAL, cache, timeout).
+    """
+    conn = sqlite3.connect(DB_NAME, timeout=BUSY_TIMEOUT, check_same_thread=False)
+    return configure_connection(conn)
+
+
 def criar_banco_dados():
     """
     Cria a estrutura do banco de dados SQLite se não existir.
-    Tabela: noticias (id, titulo, link, fonte, data_publicacao, descricao, data_coleta, titulo_pt, descricao_pt)
+    Tabela: noticias (id, titulo, link, fonte, data_publicacao, descricao, data_coleta, titulo_pt, descricao_pt, traduzido)
+    Tabela: feed_cache (url, etag, modified)
     """
-    conn = sqlite3.connect(DB_NAME)
+    conn = conectar_banco()
     cursor = conn.cursor()
     
+    # WAL: escritas do coletor não bloqueiam as leituras da API (persistente no arquivo)
+    cursor.execute("PRAGMA journal_mode=WAL")
+    
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS noticias (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -72,10 +94,17 @@ def criar_banco_dados():
             descricao TEXT,
             data_coleta TEXT NOT NULL,
             titulo_pt TEXT,
-            descricao_pt TEXT
+            descricao_pt TEXT,
+            traduzido INTEGER NOT NULL DEFAULT 0
         )
     """)
     
+    # Migração: bancos antigos não têm a coluna traduzido (já foram traduzidos na inserção)
+    colunas = [row[1] for row in cursor.execute("PRAGMA table_info(noticias)")]
+    if 'traduzido' not in colunas:
+        cursor.execute("ALTER TABLE noticias ADD COLUMN traduzido INTEGER NOT NULL DEFAULT 0")
+        cursor.execute("UPDATE noticias SET traduzido = 1")
+    
     # Criar índice para melhorar performance nas buscas
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_link ON noticias(link)
@@ -85,6 +114,30 @@ def criar_banco_dados():
         CREATE INDEX IF NOT EXISTS idx_data_publicacao ON noticias(data_publicacao)
     """)
     
+    # Cabeçalhos HTTP da última resposta de cada feed (requisições condicionais)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS feed_cache (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            modified TEXT
+        )
+    """)
+    
+    # Filtro por fonte já ordenado por data (também cobre o GROUP BY fonte)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_fonte_pub ON noticias(fonte, data_publicacao DESC)
+    """)
+    
+    # MAX(data_coleta) e limpeza por data de coleta
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_data_coleta ON noticias(data_coleta)
+    """)
+    
+    # Índice parcial: só as notícias aguardando o tradutor em segundo plano
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_traducao_pendente ON noticias(id) WHERE traduzido = 0
+    """)
+    
     conn.commit()
     conn.close()
     print(f"✓ Banco de dados '{DB_NAME}' inicializado com sucesso.")
@@ -96,7 +149,7 @@ def limpar_noticias_antigas():
     Usa a data de COLETA (não publicação) para determinar quais notícias remover.
     Isso evita problemas com feeds RSS que têm datas incorretas.
     """
-    conn = sqlite3.connect(DB_NAME)
+    conn = conectar_banco()
     cursor = conn.cursor()
     
     # Calcular timestamp de 24 horas atrás em UTC
@@ -119,51 +172,134 @@ def limpar_noticias_antigas():
     return deletadas
 
 
-def inserir_noticia(titulo: str, link: str, fonte: str, data_pub: Optional[str], descricao: str) -> bool:
+def montar_noticia(titulo: str, link: str, fonte: str, data_pub: Optional[str], descricao: str) -> tuple:
     """
-    Insere uma notícia no banco de dados se ela não existir.
-    Traduz título e descrição automaticamente se não estiverem em português.
-    Retorna True se inseriu, False se já existia.
+    Monta a linha de uma notícia pronta para inserção no banco.
+    A tradução é feita depois, em segundo plano (ver iniciar_tradutor()).
+    Retorna a tupla na ordem das colunas usadas por inserir_noticias().
     """
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
+    # Data de coleta em formato ISO com timezone UTC
+    data_coleta = datetime.now(timezone.utc).isoformat()
     
-    try:
-        # Data de coleta em formato ISO com timezone UTC
-        data_coleta = datetime.now(timezone.utc).isoformat()
-        
-        # Detectar idioma e traduzir apenas se necessário
-        titulo_pt = None
-        descricao_pt = None
-        
+    return (titulo, link, fonte, data_pub, descricao, data_coleta)
+
+
+def inserir_noticias(conn: sqlite3.Connection, noticias: List[tuple]) -> int:
+    """
+    Insere um lote de notícias em uma única transação.
+    Links já existentes são ignorados (constraint UNIQUE) - DUPLICAÇÃO PREVENIDA.
+    As notícias entram sem tradução (traduzido = 0) e ficam visíveis na hora.
+    Retorna o número de notícias efetivamente inseridas.
+    """
+    if not noticias:
+        return 0
+    
+    with conn:
+        cursor = conn.executemany("""
+            INSERT OR IGNORE INTO noticias (titulo, link, fonte, data_publicacao, descricao, data_coleta)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, noticias)
+    
+    # Em executemany, rowcount soma apenas as linhas realmente inseridas (ignoradas não contam)
+    return cursor.rowcount
+
+
+def traduzir_noticias(conn: sqlite3.Connection, noticias: List[tuple]) -> int:
+    """
+    Detecta o idioma das notícias e traduz em lote título e descrição
+    das que não estão em português. Todas são marcadas como traduzido = 1.
+    Recebe tuplas (id, titulo, descricao) e retorna quantas foram traduzidas.
+    """
+    # Coletar todos os textos que precisam de tradução
+    textos = []
+    for _, titulo, descricao in noticias:
         idioma_titulo = detectar_idioma(titulo)
-        if idioma_titulo and idioma_titulo != 'pt':
-            titulo_pt = traduzir_texto(titulo)
-        
-        if descricao:
-            idioma_desc = detectar_idioma(descricao)
-            if idioma_desc and idioma_desc != 'pt':
-                descricao_pt = traduzir_texto(descricao)
+        textos.append(titulo if idioma_titulo and idioma_titulo != 'pt' else None)
         
-        cursor.execute("""
-            INSERT INTO noticias (titulo, link, fonte, data_publicacao, descricao, data_coleta, titulo_pt, descricao_pt)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (titulo, link, fonte, data_pub, descricao, data_coleta, titulo_pt, descricao_pt))
-        
-        conn.commit()
-        conn.close()
-        return True
-    except sqlite3.IntegrityError:
-        # Link já existe no banco - DUPLICAÇÃO PREVENIDA
-        conn.close()
-        return False
+        idioma_desc = detectar_idioma(descricao) if descricao else None
+        textos.append(descricao if idioma_desc and idioma_desc != 'pt' else None)
+    
+    pendentes = [texto for texto in textos if texto]
+    traducoes = iter(traduzir_lote(pendentes) if pendentes else [])
+    textos_pt = [next(traducoes) if texto else None for texto in textos]
+    
+    atualizacoes = []
+    for i, (noticia_id, _, _) in enumerate(noticias):
+        atualizacoes.append((textos_pt[2 * i], textos_pt[2 * i + 1], noticia_id))
+    
+    with conn:
+        conn.executemany("""
+            UPDATE noticias SET titulo_pt = ?, descricao_pt = ?, traduzido = 1 WHERE id = ?
+        """, atualizacoes)
+    
+    return sum(1 for titulo_pt, descricao_pt, _ in atualizacoes if titulo_pt or descricao_pt)
+
+
+def traduzir_pendentes(conn: sqlite3.Connection, limite: int = LOTE_TRADUCAO) -> int:
+    """
+    Processa um lote de notícias ainda não traduzidas (traduzido = 0).
+    Retorna quantas notícias foram processadas (0 quando não há pendentes).
+    """
+    noticias = conn.execute("""
+        SELECT id, titulo, descricao
+        FROM noticias
+        WHERE traduzido = 0
+        ORDER BY id
+        LIMIT ?
+    """, (limite,)).fetchall()
+    
+    if noticias:
+        traduzir_noticias(conn, noticias)
+    
+    return len(noticias)
+
+
+def iniciar_tradutor(intervalo: int = INTERVALO_TRADUCAO) -> threading.Thread:
+    """
+    Inicia a thread (daemon) que traduz as notícias pendentes em segundo plano.
+    A coleta não espera a tradução: títulos originais ficam disponíveis na hora
+    e titulo_pt/descricao_pt são preenchidos em seguida.
+    """
+    def executar():
+        conn = conectar_banco()
+        while True:
+            try:
+                # Esvaziar a fila antes de voltar a esperar
+                while traduzir_pendentes(conn):
+                    pass
+            except Exception as e:
+                print(f"⚠️  Erro no tradutor: {str(e)}")
+            time.sleep(intervalo)
+    
+    tradutor = threading.Thread(target=executar, name="tradutor", daemon=True)
+    tradutor.start()
+    return tradutor
+
+
+def obter_cache_feeds(conn: sqlite3.Connection) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    Retorna o ETag e o Last-Modified salvos de cada feed: {url: (etag, modified)}.
+    """
+    rows = conn.execute("SELECT url, etag, modified FROM feed_cache").fetchall()
+    return {url: (etag, modified) for url, etag, modified in rows}
+
+
+def salvar_cache_feed(conn: sqlite3.Connection, url: str, etag: Optional[str], modified: Optional[str]):
+    """
+    Guarda os cabeçalhos da última resposta do feed para a próxima requisição condicional.
+    """
+    with conn:
+        conn.execute("""
+            INSERT OR REPLACE INTO feed_cache (url, etag, modified)
+            VALUES (?, ?, ?)
+        """, (url, etag, modified))
 
 
 def obter_todas_noticias() -> List[Dict]:
     """
     Retorna todas as notícias do banco ordenadas da mais recente para a mais antiga.
     """
-    conn = sqlite3.connect(DB_NAME)
+    conn = conectar_banco()
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -191,6 +327,11 @@ def obter_todas_noticias() -> List[Dict]:
 
 # ==================== LIMPEZA E TRADUÇÃO ====================
 
+# Expressões compiladas uma única vez (usadas em toda entrada de RSS)
+REGEX_TAG_HTML = re.compile(r'<[^>]+>')
+REGEX_ESPACOS = re.compile(r'\s+')
+
+
 def limpar_html(texto: str) -> str:
     """
     Remove todas as tags HTML e limpa o texto.
@@ -202,10 +343,10 @@ def limpar_html(texto: str) -> str:
     texto = unescape(texto)
     
     # Remover tags HTML
-    texto = re.sub(r'<[^>]+>', '', texto)
+    texto = REGEX_TAG_HTML.sub('', texto)
     
     # Remover múltiplos espaços
-    texto = re.sub(r'\s+', ' ', texto)
+    texto = REGEX_ESPACOS.sub(' ', texto)
     
     # Limitar tamanho
     if len(texto) > 500:
@@ -248,6 +389,56 @@ def traduzir_texto(texto: str, idioma_origem: str = 'auto') -> Optional[str]:
         return None
 
 
+def traduzir_lote(textos: List[str]) -> List[Optional[str]]:
+    """
+    Traduz vários textos para português com o mínimo de requisições.
+    Os textos são unidos por quebra de linha em grupos de até LIMITE_LOTE_TRADUCAO
+    caracteres; se a resposta não preservar as linhas, o grupo é traduzido item a item.
+    Retorna as traduções na mesma ordem (None onde não houve tradução).
+    """
+    traducoes = []
+    grupo = []
+    tamanho = 0
+    
+    for texto in textos:
+        # Quebras de linha são o separador do lote
+        texto = texto.replace('\n', ' ')
+        if grupo and tamanho + len(texto) + 1 > LIMITE_LOTE_TRADUCAO:
+            traducoes.extend(_traduzir_grupo(grupo))
+            grupo = []
+            tamanho = 0
+        grupo.append(texto)
+        tamanho += len(texto) + 1
+    
+    if grupo:
+        traducoes.extend(_traduzir_grupo(grupo))
+    
+    return traducoes
+
+
+def _traduzir_grupo(grupo: List[str]) -> List[Optional[str]]:
+    """Traduz um grupo de textos em uma única requisição"""
+    if len(grupo) == 1:
+        return [traduzir_texto(grupo[0])]
+    
+    try:
+        translator = GoogleTranslator(source='auto', target='pt')
+        resultado = translator.translate('\n'.join(grupo))
+        linhas = resultado.split('\n') if resultado else []
+    except Exception as e:
+        print(f"⚠️  Erro na tradução em lote: {str(e)}")
+        linhas = []
+    
+    if len(linhas) != len(grupo):
+        # Resposta desalinhada: traduzir individualmente
+        return [traduzir_texto(texto) for texto in grupo]
+    
+    return [
+        linha.strip() if linha.strip() and linha.strip() != texto else None
+        for linha, texto in zip(linhas, grupo)
+    ]
+
+
 # ==================== COLETA DE RSS ====================
 
 def parsear_data(entry) -> Optional[str]:
@@ -270,14 +461,22 @@ def parsear_data(entry) -> Optional[str]:
     return datetime.now(timezone.utc).isoformat()
 
 
-def coletar_feed(feed_url: str, fonte: str) -> int:
+def coletar_feed(feed_url: str, fonte: str, etag: Optional[str] = None,
+                 modified: Optional[str] = None) -> Tuple[List[tuple], Optional[str], Optional[str]]:
     """
-    Coleta notícias de um feed RSS específico.
-    Retorna o número de notícias novas inseridas.
+    Baixa e processa as notícias de um feed RSS específico.
+    Envia ETag/Last-Modified da coleta anterior: se o feed não mudou (HTTP 304),
+    nada é baixado nem parseado.
+    Não acessa o banco: pode rodar em paralelo com os demais feeds.
+    Retorna (linhas prontas para inserir_noticias(), novo etag, novo modified).
     """
     try:
-        feed = feedparser.parse(feed_url)
-        novas = 0
+        feed = feedparser.parse(feed_url, etag=etag, modified=modified)
+        noticias = []
+        
+        # Feed inalterado desde a última coleta
+        if feed.get('status') == 304:
+            return noticias, etag, modified
         
         for entry in feed.entries:
             titulo = entry.get('title', 'Sem título')
@@ -289,15 +488,14 @@ def coletar_feed(feed_url: str, fonte: str) -> int:
             
             data_pub = parsear_data(entry)
             
-            # Tentar inserir no banco
-            if link and inserir_noticia(titulo, link, fonte, data_pub, descricao):
-                novas += 1
+            if link:
+                noticias.append(montar_noticia(titulo, link, fonte, data_pub, descricao))
         
-        return novas
+        return noticias, feed.get('etag'), feed.get('modified')
     
     except Exception as e:
         print(f"⚠️  Erro ao coletar {fonte}: {str(e)}")
-        return 0
+        return [], etag, modified
 
 
 def coletar_todos_feeds() -> int:
@@ -311,17 +509,44 @@ def coletar_todos_feeds() -> int:
     
     total_novas = 0
     
-    for feed in RSS_FEEDS:
-        print(f"📡 Coletando: {feed['fonte']}...", end=" ")
-        sys.stdout.flush()
-        
-        novas = coletar_feed(feed['url'], feed['fonte'])
-        total_novas += novas
+    # Uma única conexão de escrita para todos os feeds
+    conn = conectar_banco()
+    
+    try:
+        cache_feeds = obter_cache_feeds(conn)
         
-        if novas > 0:
-            print(f"✓ {novas} nova(s)")
-        else:
-            print("✓ Nenhuma nova")
+        # Downloads em paralelo; escrita no banco serializada nesta thread
+        with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as executor:
+            resultados = executor.map(
+                lambda feed: coletar_feed(
+                    feed['url'], feed['fonte'], *cache_feeds.get(feed['url'], (None, None))
+                ),
+                RSS_FEEDS
+            )
+            
+            for feed, (noticias, etag, modified) in zip(RSS_FEEDS, resultados):
+                print(f"📡 Coletando: {feed['fonte']}...", end=" ")
+                sys.stdout.flush()
+                
+                try:
+                    novas = inserir_noticias(conn, noticias)
+                    
+                    # Cabeçalhos salvos só após as notícias: se a inserção falhar,
+                    # o feed é baixado por completo na próxima coleta
+                    if (etag, modified) != cache_feeds.get(feed['url'], (None, None)):
+                        salvar_cache_feed(conn, feed['url'], etag, modified)
+                except sqlite3.Error as e:
+                    print(f"⚠️  Erro ao salvar {feed['fonte']}: {str(e)}")
+                    continue
+                
+                total_novas += novas
+                
+                if novas > 0:
+                    print(f"✓ {novas} nova(s)")
+                else:
+                    print("✓ Nenhuma nova")
+    finally:
+        conn.close()
     
     print(f"\n✅ Coleta finalizada: {total_novas} notícia(s) nova(s) no total.")
     
@@ -407,6 +632,15 @@ def main():
         # Modo manual: uma coleta e exibição
         print("\n🔧 Modo: Atualização Manual")
         coletar_todos_feeds()
+        
+        # Sem loop contínuo: traduzir tudo antes de exibir
+        conn = conectar_banco()
+        try:
+            while traduzir_pendentes(conn):
+                pass
+        finally:
+            conn.close()
+        
         exibir_noticias()
         print("✓ Atualização concluída.\n")
     else:
@@ -415,6 +649,9 @@ def main():
         print(f"⏱️  Intervalo: {args.interval} segundos")
         print("⚠️  Pressione Ctrl+C para interromper\n")
         
+        # Tradução em segundo plano, fora do caminho da coleta
+        iniciar_tradutor()
+        
         try:
             while True:
                 coletar_todos_feeds()
@@ -14,15 +14,8 @@ sleep 5
 
 # Iniciar API em foreground
 echo "🌐 Iniciando API server..."
-gunicorn api_server:app \
-    --bind 0.0.0.0:${PORT:-8080} \
-    --workers 1 \
-    --threads 2 \
-    --timeout 120 \
-    --max-requests 1000 \
-    --max-requests-jitter 50 \
-    --access-logfile - \
-    --error-logfile -
+# Configuração em gunicorn.conf.py (workers gevent)
+gunicorn -c gunicorn.conf.py wsgi:app
 
 # Se API cair, matar coletor também
 kill $COLLECTOR_PID 2>/dev/null
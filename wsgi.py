@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Entrypoint WSGI de produção (Gunicorn + workers gevent)
+O monkey patch precisa acontecer antes de importar a API
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+from api_server import app  # noqa: E402